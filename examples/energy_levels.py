@@ -10,7 +10,7 @@ sys.path.insert(0, '..')
 
 import numpy as np
 import matplotlib.pyplot as plt
-from src.wavefunctions import energy_eigenvalue
+from src.wavefunctions import energy_eigenvalue, energy_eigenvalue_vec
 
 
 def calculate_energy_levels(n_max=5):
@@ -32,7 +32,7 @@ def calculate_energy_levels(n_max=5):
     n_values = np.arange(1, n_max + 1)
     
     # Energy in atomic units (Hartree)
-    energies_au = np.array([energy_eigenvalue(n) for n in n_values])
+    energies_au = energy_eigenvalue_vec(n_values)
     
     # Convert to eV (1 Hartree = 27.211 eV)
     energies_ev = energies_au * 27.211
@@ -50,12 +50,14 @@ def print_energy_table(n_max=5):
     print(f"{'n':<5} {'E_n (eV)':<15} {'E_n (Hartree)':<15} {'Rydberg Constant':<15}")
     print("-"*60)
     
-    for n in range(1, n_max + 1):
-        E_hartree = energy_eigenvalue(n)
-        E_ev = E_hartree * 27.211
-        E_rydberg = E_hartree * 2  # 1 Ry = 0.5 Hartree
-        
-        print(f"{n:<5} {E_ev:<15.4f} {E_hartree:<15.6f} {E_rydberg:<15.6f}")
+    ns = np.arange(1, n_max + 1)
+    E_h = energy_eigenvalue_vec(ns)
+    E_ev = E_h * 27.211
+    E_ry = E_h * 2  # 1 Ry = 0.5 Hartree
+    
+    lines = [f"{n:<5} {ev:<15.4f} {h:<15.6f} {ry:<15.6f}"
+             for n, ev, h, ry in zip(ns, E_ev, E_h, E_ry)]
+    print("\n".join(lines))
     
     print("="*60)
     print("Note: Rydberg constant Ry = 13.6 eV")
@@ -88,8 +90,8 @@ def plot_energy_levels(n_max=5):
     
     for n_upper, n_lower, label in transitions:
         if n_upper <= n_max:
-            E_upper = calculate_energy_levels(n_upper)[1][-1] if n_upper == n_max else energy_eigenvalue(n_upper) * 27.211
-            E_lower = energy_eigenvalue(n_lower) * 27.211
+            E_upper = energies[n_upper - 1]
+            E_lower = energies[n_lower - 1]
             
             E_trans = E_upper - E_lower
             
@@ -55,6 +55,13 @@ setup(
             "sphinx>=4.0.0",
             "sphinx-rtd-theme>=1.0.0",
         ],
+        "perf": [
+            "numba>=0.53.0",
+        ],
+        # Only used by hydrogen_radial when Numba is not installed
+        "numexpr": [
+            "numexpr>=2.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
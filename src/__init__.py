@@ -11,9 +11,11 @@ __license__ = "MIT"
 
 from .wavefunctions import (
     hydrogen_wavefunction,
+    hydrogen_wavefunction_batch,
     hydrogen_radial,
     spherical_harmonic,
     probability_density_radial,
+    energy_eigenvalue_vec,
 )
 from .schrodinger import (
     energy_eigenvalue,
@@ -36,9 +38,11 @@ from .spectroscopy import (
 
 __all__ = [
     "hydrogen_wavefunction",
+    "hydrogen_wavefunction_batch",
     "hydrogen_radial",
     "spherical_harmonic",
     "probability_density_radial",
+    "energy_eigenvalue_vec",
     "energy_eigenvalue",
     "solve_radial_schrodinger",
     "finite_difference_solver",
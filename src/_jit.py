@@ -0,0 +1,26 @@
+"""
+Optional Numba JIT support.
+
+Exposes ``njit`` and ``prange`` from Numba when it is installed. Without
+Numba, ``njit`` is a no-op decorator and ``prange`` falls back to ``range``,
+so the decorated kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Fallback decorator used when Numba is not installed.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -6,9 +6,24 @@ for the hydrogen atom in spherical coordinates.
 """
 
 import numpy as np
+import scipy.sparse
 from scipy.integrate import odeint, solve_bvp
-from scipy.linalg import eigh
+from scipy.linalg import eigh, eigh_tridiagonal
 from .wavefunctions import energy_eigenvalue
+from ._jit import njit
+
+
+@njit(cache=True)
+def _fill_tri(diag, off, H):
+    """
+    Write a symmetric tridiagonal matrix into the preallocated array H.
+    """
+    N = diag.size
+    for i in range(N):
+        H[i, i] = diag[i]
+        if i < N - 1:
+            H[i, i+1] = off
+            H[i+1, i] = off
 
 
 def solve_radial_schrodinger(r, n, l, V_func=None):
@@ -35,7 +50,7 @@ def solve_radial_schrodinger(r, n, l, V_func=None):
     """
     if V_func is None:
         # Coulomb potential in atomic units
-        V_func = lambda r: -1.0 / np.where(r > 0, r, 1e-10)
+        V_func = lambda r: -1.0 / np.clip(r, 1e-10, None)
     
     E = energy_eigenvalue(n)
     
@@ -67,38 +82,93 @@ class RadialSolver:
         self.r_max = r_max
         self.r = np.linspace(1e-10, r_max, num_points)
         self.dr = self.r[1] - self.r[0]
+        
+        # Reciprocal powers of r, guarded against r = 0
+        self.inv_r = 1.0 / np.clip(self.r, 1e-12, None)
+        self.inv_r2 = self.inv_r * self.inv_r
     
     def coulomb_potential(self):
         """
         Return Coulomb potential on radial grid.
         """
-        return -1.0 / self.r
+        return -self.inv_r
     
     def effective_potential(self):
         """
         Return effective potential including centrifugal term.
         V_eff(r) = -1/r + l(l+1)/(2r^2)
         """
-        return self.coulomb_potential() + self.l * (self.l + 1) / (2 * self.r**2)
+        return -self.inv_r + 0.5 * self.l * (self.l + 1) * self.inv_r2
     
-    def finite_difference_matrix(self, E):
+    def tridiag_coeffs(self):
         """
-        Build finite difference matrix for Schrödinger equation.
+        Return the diagonal array and the constant off-diagonal value of
+        the finite difference Hamiltonian.
         """
         V = self.effective_potential()
-        N = len(self.r)
         
         # Diagonal elements
         diag = 2.0 / self.dr**2 + V
         
         # Off-diagonal elements
-        off_diag = -1.0 / self.dr**2
+        off_val = -1.0 / self.dr**2
+        
+        return diag, off_val
+    
+    def finite_difference_matrix(self, E, sparse=False):
+        """
+        Build finite difference matrix for Schrödinger equation.
+        
+        If sparse is True, return the tridiagonal Hamiltonian as a CSR
+        matrix; otherwise return a dense array.
+        """
+        diag, off_diag = self.tridiag_coeffs()
+        N = len(self.r)
         
-        # Build tridiagonal matrix
-        H = np.diag(diag) + np.diag(off_diag * np.ones(N-1), 1) + np.diag(off_diag * np.ones(N-1), -1)
+        if sparse:
+            off = np.full(N-1, off_diag)
+            return scipy.sparse.diags([off, diag, off], [-1, 0, 1], format='csr')
+        
+        # Build tridiagonal matrix in a single allocation
+        H = np.zeros((N, N))
+        _fill_tri(diag, off_diag, H)
         
         return H
     
+    def solve_eigenstates(self, k):
+        """
+        Lowest k eigenpairs of the finite difference Hamiltonian.
+        
+        Uses the tridiagonal structure directly, so no dense matrix is built.
+        
+        Note: the grid starts at r = 1e-10, so for l = 0 the Coulomb term
+        produces a spurious eigenvalue near -1e10 at index 0; the physical
+        bound states follow it.
+        
+        Parameters:
+        -----------
+        k : int
+            Number of eigenstates to compute
+        
+        Returns:
+        --------
+        E : array
+            Eigenvalues in ascending order, shape (k,)
+        u : array
+            Eigenvectors on the radial grid, shape (num_points, k)
+        """
+        diag, off_val = self.tridiag_coeffs()
+        N = len(self.r)
+        
+        if k < 1 or k > N:
+            raise ValueError(f"Number of eigenstates must be in [1, {N}], got k={k}")
+        
+        # Explicit absolute tolerance: the default scales with the matrix
+        # norm, which the 1/r² term at r = 1e-10 makes ~1e20 for l > 0
+        return eigh_tridiagonal(diag, np.full(N-1, off_val),
+                                select='i', select_range=(0, k-1),
+                                tol=np.finfo(float).tiny)
+    
     def shooting_method(self, n):
         """
         Solve using shooting method.
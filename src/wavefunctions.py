@@ -9,15 +9,87 @@ Analytical solutions for hydrogen atom wavefunctions including:
 """
 
 import numpy as np
-from scipy.special import genlaguerre, sph_harm, factorial
-from scipy.integrate import quad
+from functools import lru_cache
+from scipy.special import eval_genlaguerre, sph_harm
+from scipy.integrate import quad, simpson
+import math
 import warnings
 
+from ._jit import njit, prange, HAVE_NUMBA
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - depends on the environment
+    ne = None
+
 # Physical constants (atomic units)
 BOHR_RADIUS = 1.0  # a_0 = 1 in a.u.
 RYDBERG_ENERGY = 0.5  # Ry = 0.5 a.u.
 FINE_STRUCTURE = 1/137.036  # α (fine structure constant)
 
+# Grid size above which the NumPy path hands off to numexpr. numexpr only
+# pays off through its thread pool: single-threaded it is 2-5x slower than
+# the in-place NumPy path at every size (e.g. 0.24 vs 0.06 ms at 2**15 and
+# 17 vs 8 ms at 2**21 points for n=3, l=2), so it is skipped in that case.
+NUMEXPR_MIN_SIZE = 2**15
+
+
+@njit(cache=True)
+def _radial_kernel(r, n, l, norm, out):
+    """
+    Fused evaluation of norm * exp(-rho/2) * rho^l * L(rho) over a flat r-grid.
+    
+    L_{n-l-1}^{2l+1}(rho) is built with the three-term recurrence, which
+    stays accurate for large n where the power-series coefficients cancel.
+    """
+    deg = n - l - 1
+    alpha = 2.0*l + 1.0
+    for i in range(r.size):
+        rho = 2.0 * r[i] / n
+        # L_0 = 1, L_1 = 1 + alpha - rho,
+        # L_{k+1} = ((2k + 1 + alpha - rho) L_k - (k + alpha) L_{k-1}) / (k + 1)
+        L_prev = 1.0
+        L = 1.0
+        if deg > 0:
+            L = 1.0 + alpha - rho
+        for k in range(1, deg):
+            L_next = ((2*k + 1 + alpha - rho) * L - (k + alpha) * L_prev) / (k + 1)
+            L_prev = L
+            L = L_next
+        out[i] = norm * math.exp(-0.5 * rho) * rho**l * L
+
+
+def _norm_ratio(n, l):
+    """
+    Ratio (n-l-1)! / (2n (n+l)!) as a single product.
+    
+    Uses (n-l-1)!/(n+l)! = 1/∏_{k=n-l}^{n+l} k, which avoids the huge
+    intermediate factorials for large n.
+    """
+    p = 1.0
+    for k in range(n - l, n + l + 1):
+        p *= k
+    return 1.0 / (2*n*p)
+
+
+@lru_cache(maxsize=128)
+def _norm(n, l):
+    """
+    Cached normalization constant of the radial wavefunction R_{n,l}.
+    """
+    return math.sqrt((2.0 / n)**3 * _norm_ratio(n, l))
+
+
+@njit(parallel=True, cache=True)
+def _density_batch_kernel(r, ns, ls, norms, P):
+    """
+    Radial probability densities r² R² of several states, one row of P per state.
+    """
+    for k in prange(ns.size):
+        _radial_kernel(r, ns[k], ls[k], norms[k], P[k])
+        for i in range(r.size):
+            P[k, i] *= P[k, i] * r[i] * r[i]
+
 
 def hydrogen_radial(r, n, l, normalized=True):
     """
@@ -45,18 +117,40 @@ def hydrogen_radial(r, n, l, normalized=True):
         raise ValueError(f"Invalid quantum numbers: n={n}, l={l}")
     
     # Normalization constant
-    norm = np.sqrt((2.0 / n)**3 * factorial(n - l - 1) / (2*n*factorial(n + l)))
+    norm = _norm(n, l)
+    
+    r_flat = r.ravel()
+    
+    if HAVE_NUMBA:
+        out = np.empty_like(r_flat)
+        _radial_kernel(r_flat, n, l, norm, out)
+        return out.reshape(r.shape)[()]
     
     # Dimensionless variable
-    rho = 2 * r / n
+    rho = r_flat * (2.0 / n)
     
     # Laguerre polynomial: L^{2l+1}_{n-l-1}(rho)
-    L = genlaguerre(n - l - 1, 2*l + 1)
+    Lval = eval_genlaguerre(n - l - 1, 2*l + 1, rho)
     
-    # Radial wavefunction
-    R = norm * np.exp(-rho/2) * (rho)**l * L(rho)
+    # Large grids without Numba: multithreaded numexpr (if installed)
+    # evaluates the fused expression in cache-sized blocks. l goes into the
+    # expression as a literal so numexpr expands the power instead of
+    # calling its generic pow; each compiled string is cached.
+    if (ne is not None and r_flat.size > NUMEXPR_MIN_SIZE
+            and ne.get_num_threads() > 1):
+        out = ne.evaluate(f"norm * exp(-rho/2) * rho**{l} * Lval",
+                          local_dict={"norm": norm, "rho": rho, "Lval": Lval})
+        return out.reshape(r.shape)[()]
     
-    return R
+    # Radial wavefunction, built in place: norm * exp(-rho/2) * rho^l * L(rho)
+    out = rho * -0.5
+    np.exp(out, out=out)
+    if l > 0:
+        out *= rho**l
+    out *= Lval
+    out *= norm
+    
+    return out.reshape(r.shape)[()]
 
 
 def spherical_harmonic(theta, phi, l, m):
@@ -120,6 +214,56 @@ def hydrogen_wavefunction(r, theta, phi, n, l, m, normalize=True):
     return psi
 
 
+def hydrogen_wavefunction_batch(r, theta, phi, states):
+    """
+    Evaluate several hydrogen wavefunctions ψ_{n,l,m} on a shared grid.
+    
+    States with the same n share rho and exp(-rho/2); states with the
+    same (n, l) share the radial part.
+    
+    Parameters:
+    -----------
+    r : float or array
+        Radial coordinate
+    theta : float or array
+        Polar angle
+    phi : float or array
+        Azimuthal angle
+    states : array of shape (K, 3)
+        Quantum numbers (n, l, m) of each state
+    
+    Returns:
+    --------
+    psi : complex array
+        Wavefunction values, shape (K,) + broadcast shape of r, theta, phi
+    """
+    r = np.asarray(r, dtype=float)
+    states = np.asarray(states, dtype=int).reshape(-1, 3)
+    shape = np.broadcast_shapes(r.shape, np.shape(theta), np.shape(phi))
+    psi = np.empty((len(states),) + shape, dtype=complex)
+    
+    for n in np.unique(states[:, 0]):
+        if n < 1:
+            raise ValueError(f"Invalid quantum numbers: n={n}")
+        in_shell = np.flatnonzero(states[:, 0] == n)
+        
+        # Shared across all l for this n
+        rho = 2 * r / n
+        expfac = np.exp(-rho/2)
+        
+        for l in np.unique(states[in_shell, 1]):
+            if l < 0 or l >= n:
+                raise ValueError(f"Invalid quantum numbers: n={n}, l={l}")
+            
+            Lval = eval_genlaguerre(n - l - 1, 2*l + 1, rho)
+            R = _norm(n, l) * expfac * rho**l * Lval
+            
+            for k in in_shell[states[in_shell, 1] == l]:
+                psi[k] = R * spherical_harmonic(theta, phi, l, states[k, 2])
+    
+    return psi
+
+
 def probability_density_radial(r, n, l):
     """
     Radial probability density P(r) = r² |R(r)|².
@@ -139,9 +283,13 @@ def probability_density_radial(r, n, l):
         Radial probability density
     """
     R = hydrogen_radial(r, n, l, normalized=True)
-    P = r**2 * np.abs(R)**2
     
-    return P
+    # P = r² R², built in place (R is real)
+    R *= R
+    R *= r
+    R *= r
+    
+    return R
 
 
 def expectation_value_r(n, l):
@@ -157,11 +305,9 @@ def expectation_value_r_squared(n, l):
     """
     Expectation value <r²> for hydrogen state (n, l).
     
-    Formula: <r²> = a_0² * n⁴ * [5/2 + 1 - 3l(l+1)/(2n²)]
+    Formula: <r²> = a_0² * n²/2 * [5n² + 1 - 3l(l+1)]
     """
-    return (BOHR_RADIUS * n)**2 * (
-        n**2 * (5/2 + 1) - 3*l*(l+1)/2
-    )
+    return BOHR_RADIUS**2 * n*n * (5*n*n + 1 - 3*l*(l+1)) / 2.0
 
 
 def uncertainty_r(n, l):
@@ -195,7 +341,29 @@ def energy_eigenvalue(n):
     return -1.0 / (2 * n**2)
 
 
-def normalization_check(n, l, r_max=50, num_points=1000):
+def energy_eigenvalue_vec(n):
+    """
+    Vectorized energy eigenvalues for an array of principal quantum numbers.
+    
+    Formula: E_n = -1/(2n²) Hartree, evaluated in a single array operation
+    
+    Parameters:
+    -----------
+    n : int or array
+        Principal quantum number(s)
+    
+    Returns:
+    --------
+    E : float or array
+        Energy eigenvalue(s) in atomic units (Hartree)
+    """
+    n = np.asarray(n, dtype=float)
+    if np.any(n < 1):
+        raise ValueError("Principal quantum number n must be >= 1")
+    return -1.0 / (2.0 * n * n)
+
+
+def normalization_check(n, l, r_max=50, num_points=400):
     """
     Verify normalization of radial wavefunction.
     
@@ -203,15 +371,60 @@ def normalization_check(n, l, r_max=50, num_points=1000):
     """
     r = np.linspace(0, r_max, num_points)
     R = hydrogen_radial(r, n, l, normalized=True)
-    P = r**2 * np.abs(R)**2
     
-    # Numerical integration
-    from scipy.integrate import trapezoid
-    integral = trapezoid(P, r)
+    # P = r² R², built in place (R is real)
+    P = R
+    np.multiply(P, P, out=P)
+    P *= r*r
+    
+    # Numerical integration (Simpson's rule)
+    integral = simpson(P, x=r)
     
     return integral
 
 
+def normalization_check_batch(states, r_max=50, num_points=400):
+    """
+    Verify normalization of several radial wavefunctions on a shared grid.
+    
+    Same integral as normalization_check, evaluated for every (n, l) pair;
+    with Numba the states are computed in parallel.
+    
+    Parameters:
+    -----------
+    states : array of shape (K, 2)
+        Quantum numbers (n, l) of each state
+    r_max : float
+        Maximum radial coordinate
+    num_points : int
+        Number of grid points
+    
+    Returns:
+    --------
+    integrals : array
+        ∫₀^∞ |R(r)|² r² dr for each state, shape (K,)
+    """
+    states = np.asarray(states, dtype=int).reshape(-1, 2)
+    ns = np.ascontiguousarray(states[:, 0])
+    ls = np.ascontiguousarray(states[:, 1])
+    
+    for n, l in zip(ns, ls):
+        if n < 1 or l < 0 or l >= n:
+            raise ValueError(f"Invalid quantum numbers: n={n}, l={l}")
+    
+    r = np.linspace(0, r_max, num_points)
+    P = np.empty((len(ns), num_points))
+    
+    if HAVE_NUMBA and len(ns) > 0:
+        norms = np.array([_norm(n, l) for n, l in zip(ns, ls)])
+        _density_batch_kernel(r, ns, ls, norms, P)
+    else:
+        for k, (n, l) in enumerate(zip(ns, ls)):
+            P[k] = probability_density_radial(r, n, l)
+    
+    return simpson(P, x=r, axis=-1)
+
+
 if __name__ == "__main__":
     # Example usage
     print("Hydrogen Atom Wavefunctions Module")
@@ -0,0 +1,73 @@
+"""
+Unit tests for the radial Schrödinger equation solver.
+"""
+
+import pytest
+import numpy as np
+from scipy.linalg import eigh
+from src.schrodinger import RadialSolver
+
+
+class TestFiniteDifferenceMatrix:
+    """
+    Test finite difference Hamiltonian assembly.
+    """
+    
+    def test_dense_sparse_match_diag_sum(self):
+        """Test dense, sparse and np.diag constructions give the same matrix."""
+        solver = RadialSolver(1, r_max=20, num_points=50)
+        N = len(solver.r)
+        
+        r = solver.r
+        V = -1.0 / r + solver.l * (solver.l + 1) / (2 * r**2)
+        off = -1.0 / solver.dr**2
+        expected = (np.diag(2.0 / solver.dr**2 + V)
+                    + np.diag(off * np.ones(N-1), 1)
+                    + np.diag(off * np.ones(N-1), -1))
+        
+        H_dense = solver.finite_difference_matrix(None)
+        H_sparse = solver.finite_difference_matrix(None, sparse=True)
+        
+        assert np.allclose(H_dense, expected), "Dense matrix differs from np.diag construction"
+        assert np.allclose(H_sparse.toarray(), expected), "Sparse matrix differs from np.diag construction"
+    
+    @pytest.mark.parametrize("l", [0, 1, 3])
+    def test_potentials_match_formula(self, l):
+        """Test precomputed 1/r, 1/r² potentials against the explicit formula."""
+        solver = RadialSolver(l, r_max=20, num_points=50)
+        r = solver.r
+        
+        assert np.allclose(solver.coulomb_potential(), -1.0 / r)
+        assert np.allclose(solver.effective_potential(), -1.0 / r + l * (l + 1) / (2 * r**2)), \
+            f"Effective potential differs from -1/r + l(l+1)/(2r²) for l={l}"
+
+
+class TestSolveEigenstates:
+    """
+    Test the tridiagonal eigensolver.
+    """
+    
+    @pytest.mark.parametrize("l", [0, 1])
+    def test_matches_dense_eigh(self, l):
+        """Test eigenvalues match a dense eigh of the same matrix."""
+        solver = RadialSolver(l, r_max=40, num_points=200)
+        k = 4
+        E, u = solver.solve_eigenstates(k)
+        E_dense = eigh(solver.finite_difference_matrix(None), eigvals_only=True)[:k]
+        
+        assert u.shape == (len(solver.r), k)
+        assert np.allclose(E, E_dense), f"Expected {E_dense}, got {E}"
+    
+    def test_invalid_k(self):
+        """Test error handling for out-of-range k."""
+        solver = RadialSolver(0, r_max=20, num_points=50)
+        
+        with pytest.raises(ValueError):
+            solver.solve_eigenstates(0)
+        
+        with pytest.raises(ValueError):
+            solver.solve_eigenstates(51)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,17 +2,33 @@
 Unit tests for hydrogen atom wavefunctions.
 """
 
+import math
+
 import pytest
 import numpy as np
+from scipy.special import eval_genlaguerre
+from src import wavefunctions
 from src.wavefunctions import (
     hydrogen_radial,
+    hydrogen_wavefunction,
+    hydrogen_wavefunction_batch,
     energy_eigenvalue,
+    energy_eigenvalue_vec,
     normalization_check,
+    normalization_check_batch,
     expectation_value_r,
+    expectation_value_r_squared,
     probability_density_radial,
 )
 
 
+def radial_reference(r, n, l):
+    """Reference R_{n,l}(r) from scipy's eval_genlaguerre and exact factorials."""
+    rho = 2 * np.asarray(r, dtype=float) / n
+    norm = math.sqrt((2.0 / n)**3 * math.factorial(n - l - 1) / (2*n*math.factorial(n + l)))
+    return norm * np.exp(-rho/2) * rho**l * eval_genlaguerre(n - l - 1, 2*l + 1, rho)
+
+
 class TestEnergyEigenvalues:
     """
     Test energy eigenvalue calculations.
@@ -36,6 +52,13 @@ class TestEnergyEigenvalues:
         for i in range(len(energies) - 1):
             assert energies[i] < energies[i+1], "Energies not monotonically increasing"
     
+    def test_vectorized_energy(self):
+        """Test vectorized energies match the scalar formula."""
+        n_values = np.arange(1, 6)
+        E = energy_eigenvalue_vec(n_values)
+        expected = [energy_eigenvalue(n) for n in n_values]
+        assert np.allclose(E, expected), "Vectorized energies do not match scalar values"
+    
     def test_invalid_quantum_numbers(self):
         """Test error handling for invalid quantum numbers."""
         with pytest.raises(ValueError):
@@ -59,6 +82,77 @@ class TestRadialWavefunction:
         dR = np.diff(R)
         assert np.all(dR <= 0), "1s orbital should be monotonically decreasing"
     
+    @pytest.mark.parametrize("n,l", [(30, 0), (35, 4), (40, 0), (40, 10)])
+    def test_high_n_matches_eval_genlaguerre(self, n, l):
+        """Test high-n radial functions against scipy's Laguerre evaluation."""
+        r = np.linspace(0, 400, 4000)
+        expected = radial_reference(r, n, l)
+        
+        R = hydrogen_radial(r, n, l)
+        scale = np.max(np.abs(expected))
+        assert np.allclose(R, expected, rtol=1e-8, atol=1e-10 * scale), f"Mismatch for n={n}, l={l}"
+    
+    def test_numpy_path(self, monkeypatch):
+        """Test the NumPy (no Numba) path of the radial functions."""
+        monkeypatch.setattr(wavefunctions, "HAVE_NUMBA", False)
+        r = np.linspace(0, 60, 500)
+        
+        for n, l in [(1, 0), (2, 1), (4, 2), (30, 3)]:
+            expected = radial_reference(r, n, l)
+            R = hydrogen_radial(r, n, l)
+            assert np.allclose(R, expected, rtol=1e-10, atol=1e-12), f"NumPy path mismatch for n={n}, l={l}"
+            
+            P = probability_density_radial(r, n, l)
+            assert np.allclose(P, r**2 * expected**2, rtol=1e-10, atol=1e-12), f"Density mismatch for n={n}, l={l}"
+        
+        assert np.isclose(hydrogen_radial(1.5, 2, 1), radial_reference(1.5, 2, 1))
+        assert np.isclose(normalization_check(n=2, l=1), 1.0, atol=1e-2)
+    
+    def test_numexpr_path(self, monkeypatch):
+        """Test the numexpr branch used for large grids without Numba."""
+        ne = pytest.importorskip("numexpr")
+        monkeypatch.setattr(wavefunctions, "HAVE_NUMBA", False)
+        monkeypatch.setattr(ne, "get_num_threads", lambda: 2)
+        
+        expressions = []
+        evaluate = ne.evaluate
+        
+        def recording_evaluate(ex, *args, **kwargs):
+            expressions.append(ex)
+            return evaluate(ex, *args, **kwargs)
+        
+        monkeypatch.setattr(ne, "evaluate", recording_evaluate)
+        r = np.linspace(0, 80, wavefunctions.NUMEXPR_MIN_SIZE + 1001)
+        
+        for n, l in [(1, 0), (3, 2), (12, 5)]:
+            expected = radial_reference(r, n, l)
+            R = hydrogen_radial(r, n, l)
+            assert np.allclose(R, expected, rtol=1e-10, atol=1e-12), f"numexpr path mismatch for n={n}, l={l}"
+            # The exponent must be a literal, not numexpr's generic pow
+            assert f"rho**{l} " in expressions[-1], f"Unexpected expression {expressions[-1]!r}"
+    
+    def test_numexpr_skipped_single_thread(self, monkeypatch):
+        """Test single-threaded numexpr is bypassed for the faster in-place path."""
+        ne = pytest.importorskip("numexpr")
+        monkeypatch.setattr(wavefunctions, "HAVE_NUMBA", False)
+        monkeypatch.setattr(ne, "get_num_threads", lambda: 1)
+        
+        def failing_evaluate(*args, **kwargs):
+            raise AssertionError("numexpr should not be used with one thread")
+        
+        monkeypatch.setattr(ne, "evaluate", failing_evaluate)
+        r = np.linspace(0, 80, wavefunctions.NUMEXPR_MIN_SIZE + 1001)
+        assert np.allclose(hydrogen_radial(r, 3, 2), radial_reference(r, 3, 2))
+    
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_probability_density(self, monkeypatch, use_numba):
+        """Test P(r) = r² R(r)² on both evaluation paths."""
+        monkeypatch.setattr(wavefunctions, "HAVE_NUMBA", use_numba and wavefunctions.HAVE_NUMBA)
+        r = np.linspace(0, 30, 300)
+        R = hydrogen_radial(r, n=3, l=1)
+        P = probability_density_radial(r, n=3, l=1)
+        assert np.allclose(P, r**2 * R**2), "P(r) should equal r² R(r)²"
+    
     def test_normalization_1s(self):
         """Test normalization of 1s orbital."""
         norm = normalization_check(n=1, l=0)
@@ -69,6 +163,21 @@ class TestRadialWavefunction:
         norm = normalization_check(n=2, l=0)
         assert np.isclose(norm, 1.0, atol=1e-2), f"2s normalization: expected 1.0, got {norm}"
     
+    def test_normalization_batch(self):
+        """Test batched normalization of all states up to n=3."""
+        states = [(n, l) for n in range(1, 4) for l in range(n)]
+        norms = normalization_check_batch(states)
+        expected = [normalization_check(n, l) for n, l in states]
+        assert np.allclose(norms, expected), "Batched normalization does not match single-state values"
+        assert np.allclose(norms, 1.0, atol=1e-2), f"Batched normalization: expected 1.0, got {norms}"
+    
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_normalization_batch_high_n(self, monkeypatch, use_numba):
+        """Test batched normalization of high-n states on both evaluation paths."""
+        monkeypatch.setattr(wavefunctions, "HAVE_NUMBA", use_numba and wavefunctions.HAVE_NUMBA)
+        norms = normalization_check_batch([(40, 0), (50, 0)], r_max=8000, num_points=20001)
+        assert np.allclose(norms, 1.0, atol=1e-4), f"High-n batched normalization: expected 1.0, got {norms}"
+    
     def test_invalid_quantum_numbers(self):
         """Test error handling for invalid quantum numbers."""
         r = np.linspace(0.1, 10, 100)
@@ -83,6 +192,36 @@ class TestRadialWavefunction:
             hydrogen_radial(r, n=1, l=-1)  # l must be >= 0
 
 
+class TestWavefunctionBatch:
+    """
+    Test batched wavefunction evaluation.
+    """
+    
+    def test_batch_matches_single(self):
+        """Test batched states match individual hydrogen_wavefunction calls."""
+        r = np.linspace(0.1, 10, 20)
+        theta = np.linspace(0, np.pi, 20)
+        phi = np.linspace(0, 2*np.pi, 20)
+        states = [(1, 0, 0), (2, 1, -1), (2, 0, 0), (3, 2, 1), (2, 1, 1)]
+        
+        psi = hydrogen_wavefunction_batch(r, theta, phi, states)
+        assert psi.shape == (len(states),) + r.shape
+        
+        for k, (n, l, m) in enumerate(states):
+            expected = hydrogen_wavefunction(r, theta, phi, n, l, m)
+            assert np.allclose(psi[k], expected), f"Batch mismatch for state {(n, l, m)}"
+    
+    def test_invalid_quantum_numbers(self):
+        """Test error handling for invalid quantum numbers."""
+        r = np.linspace(0.1, 10, 20)
+        
+        with pytest.raises(ValueError):
+            hydrogen_wavefunction_batch(r, 0.5, 0.5, [(2, 2, 0)])
+        
+        with pytest.raises(ValueError):
+            hydrogen_wavefunction_batch(r, 0.5, 0.5, [(2, 1, 2)])
+
+
 class TestExpectationValues:
     """
     Test expectation value calculations.
@@ -105,6 +244,12 @@ class TestExpectationValues:
         
         # 2s should be farther from nucleus than 2p
         assert r_2s > r_2p, "<r> for 2s should be > <r> for 2p"
+    
+    def test_expectation_r_squared(self):
+        """Test <r²> against the closed form for 1s and 2p."""
+        # For n=1, l=0: <r²> = 3 a_0²; for n=2, l=1: <r²> = 30 a_0²
+        assert np.isclose(expectation_value_r_squared(1, 0), 3.0)
+        assert np.isclose(expectation_value_r_squared(2, 1), 30.0)
 
 
 if __name__ == "__main__":